@@ -2,6 +2,8 @@
 """
 General-purpose Tkinter GUI wrapper class.
 """
+import functools
+import os
 import tkinter as tk
 import sys
 from PIL import Image, ImageTk
@@ -29,6 +31,13 @@ class EasyGUI(tk.Frame):
 
         self._EventLock = False
 
+        # Precomputed gridding arguments
+        self._GridKwargs = None
+
+        # Last-written values of string variables and label texts
+        self._LastStrings = {}
+        self._LastLabels = {}
+
         # Menu bar
         self._BooleanVars = {}
         self._Buttons = {}
@@ -152,6 +161,7 @@ class EasyGUI(tk.Frame):
         raise NotImplementedError
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def from_rgb(r, g, b) -> str:
         """
         Converts an RGB sequence into a Tkinter-recognized color string.
@@ -186,16 +196,35 @@ class EasyGUI(tk.Frame):
     def open_image(path, w, h, antialias=True) -> ImageTk.PhotoImage:
         """
         Opens an image from file into a Tkinter-compatible format.
+        Results are cached until the file is modified, so repeated requests
+        share one PhotoImage.
 
         :param path:      Relative path to image.
         :param w:         Width to resize to.
         :param h:         Height to resize to.
         :param antialias: Whether to antialias. (Default True).
 
+        :return: Tkinter PhotoImage object.
+        """
+        mtime = os.stat(path).st_mtime_ns
+        return EasyGUI.open_image_cached(path, mtime, w, h, antialias)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def open_image_cached(path, mtime, w, h, antialias) -> ImageTk.PhotoImage:
+        """
+        Opens an image from file into a Tkinter-compatible format.
+
+        :param path:      Relative path to image.
+        :param mtime:     Modification time of file. (Nanoseconds).
+        :param w:         Width to resize to.
+        :param h:         Height to resize to.
+        :param antialias: Whether to antialias.
+
         :return: Tkinter PhotoImage object.
         """
         image = Image.open(path)
-        aliasing = Image.ANTIALIAS if antialias else Image.NEAREST
+        aliasing = Image.LANCZOS if antialias else Image.NEAREST
         return ImageTk.PhotoImage(image.resize((w, h), aliasing))
 
     @staticmethod
@@ -210,11 +239,30 @@ class EasyGUI(tk.Frame):
         :return: None.
         """
         try:
-            container[tag].destroy()
+            if container[tag] is not widget:
+                container[tag].destroy()
         except KeyError:
             pass
         container[tag] = widget
 
+    @staticmethod
+    def reuse_widget(container, tag, master, kind):
+        """
+        Retrieves a local widget for reconfiguration, provided it's of the
+        expected type and belongs to the given master.
+
+        :param container: Source container of widgets.
+        :param tag:       Tag of widget to reuse.
+        :param master:    Expected root widget.
+        :param kind:      Expected widget class.
+
+        :return: Existing widget if reusable; None otherwise.
+        """
+        widget = container.get(tag, None)
+        if isinstance(widget, kind) and widget.master is master:
+            return widget
+        return None
+
     @staticmethod
     def toggle_radio(radiobutton, selected) -> None:
         """
@@ -367,6 +415,27 @@ class EasyGUI(tk.Frame):
             frame = self._Frames[key] = tk.Frame()
         return frame
 
+    def get_grid_kwargs(self, key) -> dict:
+        """
+        Retrieves gridding arguments (row, column, and padding) for a local
+        widget. Arguments for all widgets are computed on first call.
+
+        :param key: Key of widget to grid.
+
+        :return: Dictionary of keyword arguments to widget.grid().
+        """
+        if self._GridKwargs is None:
+            pad = self.pad
+            self._GridKwargs = {
+                k: {
+                    "row":    v[0],
+                    "column": v[1],
+                    "padx":   pad.get(k, [0, 0])[0],
+                    "pady":   pad.get(k, [0, 0])[1],
+                } for k, v in self.grid.items()
+            }
+        return self._GridKwargs[key]
+
     def get_string_var(self, key) -> tk.StringVar:
         """
         Safely retrieves a Tkinter string variable. Creates one at the given
@@ -461,9 +530,11 @@ class EasyGUI(tk.Frame):
 
         :return:
         """
-        w, h = self.sizes.get(tag, self.sizes["default-button"])
-        fg = self.from_rgb(*self.colors[tag]["fg"])
-        bg = self.from_rgb(*self.colors[tag]["bg"])
+        sizes = self.sizes
+        colors = self.colors[tag]
+        w, h = sizes.get(tag, sizes["default-button"])
+        fg = self.from_rgb(*colors["fg"])
+        bg = self.from_rgb(*colors["bg"])
 
         path = self.images.get(tag, "")
         if path:
@@ -471,9 +542,14 @@ class EasyGUI(tk.Frame):
         else:
             image = None
 
-        button = tk.Button(master, text=self.labels[tag], command=command)
+        button = self.reuse_widget(self._Buttons, tag, master, tk.Button)
+        if button is None:
+            button = tk.Button(master)
+
         button.image = image
         button.config(
+            text=self.labels[tag],
+            command=command,
             width=w,
             height=h,
             foreground=fg,
@@ -500,12 +576,7 @@ class EasyGUI(tk.Frame):
                     highlightcolor=bg,
                 )
 
-        button.grid(
-            row=self.grid[tag][0],
-            column=self.grid[tag][1],
-            padx=self.pad[tag][0],
-            pady=self.pad[tag][1],
-        )
+        button.grid(**self.get_grid_kwargs(tag))
 
         self.replace_widget(self._Buttons, tag, button)
 
@@ -520,21 +591,20 @@ class EasyGUI(tk.Frame):
 
         :return:
         """
-        canvas = tk.Canvas(
-            master,
-            width=self.sizes[tag][0],
-            height=self.sizes[tag][1],
+        w, h = self.sizes[tag]
+        canvas = self.reuse_widget(self._Canvases, tag, master, tk.Canvas)
+        if canvas is None:
+            canvas = tk.Canvas(master)
+
+        canvas.config(
+            width=w,
+            height=h,
             background=self.from_rgb(*self.colors[tag]["bg"]),
             relief=tk.SUNKEN,
             borderwidth=border,
         )
 
-        canvas.grid(
-            row=self.grid[tag][0],
-            column=self.grid[tag][1],
-            padx=self.pad[tag][0],
-            pady=self.pad[tag][1],
-        )
+        canvas.grid(**self.get_grid_kwargs(tag))
 
         self.replace_widget(self._Canvases, tag, canvas)
 
@@ -550,19 +620,21 @@ class EasyGUI(tk.Frame):
 
         :return:
         """
-        checkbox = tk.Checkbutton(
-            master,
+        checkbox = self.reuse_widget(
+            self._Checkboxes, tag, master, tk.Checkbutton
+        )
+        if checkbox is None:
+            checkbox = tk.Checkbutton(master)
+
+        checkbox.config(
             text=self.labels[tag],
             variable=self.get_boolean_var(tag),
+            command=command,
         )
 
         checkbox.grid(
-            row=self.grid[tag][0],
-            column=self.grid[tag][1],
-            padx=self.pad[tag][0],
-            pady=self.pad[tag][1],
             sticky=sticky,
-            command=command,
+            **self.get_grid_kwargs(tag),
         )
 
         self.replace_widget(self._Checkboxes, tag, checkbox)
@@ -589,24 +661,27 @@ class EasyGUI(tk.Frame):
         """
         var = self.get_string_var(tag)
         var.set(text)
+        self._LastStrings[tag] = text
+
+        entry = self.reuse_widget(self._Entries, tag, master, tk.Entry)
+        if entry is None:
+            entry = tk.Entry(master)
 
-        entry = tk.Entry(
-            master,
+        entry.config(
             textvariable=var,
             width=self.sizes[tag][0],
             justify=justify,
         )
 
         entry.grid(
-            row=self.grid[tag][0],
-            column=self.grid[tag][1],
-            padx=self.pad[tag][0],
-            pady=self.pad[tag][1],
             sticky=sticky,
+            **self.get_grid_kwargs(tag),
         )
 
         if disabled:
             entry.config(state="readonly")
+        else:
+            entry.config(state=tk.NORMAL)
 
         self.replace_widget(self._Entries, tag, entry)
 
@@ -621,17 +696,18 @@ class EasyGUI(tk.Frame):
 
         :return: True.
         """
-        frame = tk.Frame(
-            master,
-            width=self.sizes[tag][0],
-            height=self.sizes[tag][1],
-        )
+        w, h = self.sizes[tag]
+        frame = self.reuse_widget(self._Frames, tag, master, tk.Frame)
+        if frame is None:
+            frame = tk.Frame(master)
 
-        frame.grid(
-            row=self.grid[tag][0],
-            column=self.grid[tag][1],
+        frame.config(
+            width=w,
+            height=h,
         )
 
+        frame.grid(**self.get_grid_kwargs(tag))
+
         self.replace_widget(self._Frames, tag, frame)
 
         return True
@@ -648,18 +724,21 @@ class EasyGUI(tk.Frame):
 
         :return: True.
         """
+        text = self.labels[tag]
         try:
-            text = self.labels[tag].format(*args)
+            text = text.format(*args)
         except IndexError:
-            text = self.labels[tag]
+            pass
+
+        label = self.reuse_widget(self._Labels, tag, master, tk.Label)
+        if label is None:
+            label = tk.Label(master)
 
-        label = tk.Label(master, font=font, text=text)
+        label.config(font=font, text=text)
+        self._LastLabels[tag] = text
         label.grid(
-            row=self.grid[tag][0],
-            column=self.grid[tag][1],
-            padx=self.pad[tag][0],
-            pady=self.pad[tag][1],
             sticky=sticky,
+            **self.get_grid_kwargs(tag),
         )
 
         self.replace_widget(self._Labels, tag, label)
@@ -679,17 +758,22 @@ class EasyGUI(tk.Frame):
         assert tag != "main-menu"
 
         get_string_var = self.get_string_var
-        menu = tk.Menu(master, tearoff=0)
         labels = self.labels
 
+        menu = self.reuse_widget(self._Menus, tag, master, tk.Menu)
+        if menu is None:
+            menu = tk.Menu(master, tearoff=0)
+            self.replace_widget(self._Menus, tag, menu)
+            self._Menus["main-menu"].add_cascade(label=labels[tag], menu=menu)
+        else:
+            # Already cascaded from main menu; just clear its entries
+            menu.delete(0, tk.END)
+
         for command in commands:
             ntag = command.get("label", "")
             fnc = command.get("command", lambda: print())
             menu.add_command(label=ntag, command=fnc)
 
-        self.replace_widget(self._Menus, tag, menu)
-        self._Menus["main-menu"].add_cascade(label=labels[tag], menu=menu)
-
         # Initialize radiobuttons (if any)
         radiobuttons = kwargs.get("radio", {})
         if radiobuttons:
@@ -718,12 +802,19 @@ class EasyGUI(tk.Frame):
         :return: True.
         """
         width = self.sizes["default-menu"][0]
-        fg = self.from_rgb(*self.colors[tag]["fg"])
-        bg = self.from_rgb(*self.colors[tag]["bg"])
-        var = self.get_string_var(tag)
-        var.set(self.labels[tag])
+        colors = self.colors[tag]
+        fg = self.from_rgb(*colors["fg"])
+        bg = self.from_rgb(*colors["bg"])
+        optionmenu = self.reuse_widget(
+            self._OptionMenus, tag, master, tk.OptionMenu
+        )
+        if optionmenu is None:
+            var = self.get_string_var(tag)
+            var.set(self.labels[tag])
+            optionmenu = tk.OptionMenu(master, var, *options)
+        else:
+            self.rebuild_option_menu(master, tag, options)
 
-        optionmenu = tk.OptionMenu(master, var, *options)
         optionmenu.config(
             width=width,
             foreground=fg,
@@ -732,12 +823,7 @@ class EasyGUI(tk.Frame):
             activebackground=bg,
         )
 
-        optionmenu.grid(
-            row=self.grid[tag][0],
-            column=self.grid[tag][1],
-            padx=self.pad[tag][0],
-            pady=self.pad[tag][1],
-        )
+        optionmenu.grid(**self.get_grid_kwargs(tag))
 
         self.replace_widget(self._OptionMenus, tag, optionmenu)
 
@@ -765,8 +851,13 @@ class EasyGUI(tk.Frame):
 
         :return:
         """
-        radio = tk.Radiobutton(
-            master,
+        radio = self.reuse_widget(
+            self._RadioButtons, tag, master, tk.Radiobutton
+        )
+        if radio is None:
+            radio = tk.Radiobutton(master)
+
+        radio.config(
             text=self.labels[tag],
             variable=variable,
             value=value,
@@ -774,11 +865,8 @@ class EasyGUI(tk.Frame):
         )
 
         radio.grid(
-            row=self.grid[tag][0],
-            column=self.grid[tag][1],
-            padx=self.pad[tag][0],
-            pady=self.pad[tag][1],
             sticky=sticky,
+            **self.get_grid_kwargs(tag),
         )
 
         self.toggle_radio(radio, select)
@@ -786,6 +874,32 @@ class EasyGUI(tk.Frame):
 
         return True
 
+    def rebuild_option_menu(self, master, tag, options) -> bool:
+        """
+        Replaces the options of an existing Tkinter optionmenu widget in place.
+        Initializes a new optionmenu if none exists yet.
+
+        :param master:  Root widget for optionmenu (if created).
+        :param tag:     Tag of optionmenu to rebuild.
+        :param options: Iterable of options to supply.
+
+        :return: True.
+        """
+        try:
+            optionmenu = self._OptionMenus[tag]
+        except KeyError:
+            return self.init_option_menu(master, tag, options)
+
+        var = self.get_string_var(tag)
+        var.set(self.labels[tag])
+
+        menu = optionmenu["menu"]
+        menu.delete(0, tk.END)
+        for option in options:
+            menu.add_command(label=option, command=tk._setit(var, option))
+
+        return True
+
     def release_event_lock(self) -> bool:
         """
         Releases the GUI's local event lock.
@@ -800,6 +914,22 @@ class EasyGUI(tk.Frame):
         )
         return True
 
+    def set_label_text(self, key, text) -> bool:
+        """
+        Sets the text of a local label, skipping the reconfiguration if its
+        text is unchanged since the last call.
+
+        :param key:  Key of label to modify.
+        :param text: String text to set.
+
+        :return: True if label was reconfigured; False otherwise.
+        """
+        if self._LastLabels.get(key, None) == text:
+            return False
+        self._Labels[key].config(text=text)
+        self._LastLabels[key] = text
+        return True
+
     def set_pending(self, key, callback, delay) -> bool:
         """
         Schedules a callback function after a given time delay.
@@ -813,6 +943,22 @@ class EasyGUI(tk.Frame):
         self._PendingJobs[key] = self.after(delay, callback)
         return True
 
+    def set_string_var(self, key, value) -> bool:
+        """
+        Sets a Tkinter string variable, skipping the write if its value is
+        unchanged since the last call.
+
+        :param key:   Key of string variable to set.
+        :param value: String value to set.
+
+        :return: True if variable was written; False otherwise.
+        """
+        if self._LastStrings.get(key, None) == value:
+            return False
+        self.get_string_var(key).set(value)
+        self._LastStrings[key] = value
+        return True
+
     def thread_it(self, callback):
         """
         Wrapper for an arbitrary callback function.
@@ -7,8 +7,9 @@ Graphical user interface layer.
 
 """
 import cv2
-import psutil
+import numpy as np
 import random
+import time
 # import threading
 import tkinter as tk
 from tkinter import messagebox
@@ -17,6 +18,8 @@ from tkinter import filedialog
 import sprite_imaging
 import sprite_splitter
 from gui import EasyGUI
+from sprite_splitter import NonexistentBodyException
+from sprite_splitter import NonexistentHeadException
 from sprite_prepare import *
 from sprite_utils import *
 
@@ -35,7 +38,7 @@ class InvalidFilenameException(Exception):
     pass
 
 
-class InvalidBodyException(sprite_splitter.NonexistentBodyException):
+class InvalidBodyException(NonexistentBodyException):
     """
     Exception thrown upon referencing an invalid body spritesheet.
     """
@@ -44,7 +47,7 @@ class InvalidBodyException(sprite_splitter.NonexistentBodyException):
         super().__init__(name)
 
 
-class InvalidHeadException(sprite_splitter.NonexistentHeadException):
+class InvalidHeadException(NonexistentHeadException):
     """
     Exception thrown upon referencing an invalid head spritesheet.
     """
@@ -68,6 +71,56 @@ class UnspecifiedHeadException(Exception):
     pass
 
 
+class AnimationState:
+    """
+    Playback state of the animated preview.
+    """
+    __slots__ = (
+        "image",
+        "init",
+        "forward",
+        "playing",
+        "objects",
+        "frame",
+        "speed",
+        "state",
+        "tick",
+    )
+
+    def __init__(self):
+        self.image = None
+        self.init = False
+        self.forward = True
+        self.playing = False
+        self.objects = []
+        self.frame = 0
+        self.speed = 6
+        self.state = STATES.idle
+        self.tick = 0.0
+
+
+class SpriteData:
+    """
+    Listing and per-frame offset data for either heads or bodies.
+    """
+    __slots__ = (
+        "choices",
+        "current",
+        "data",
+        "key",
+        "list",
+        "offset",
+    )
+
+    def __init__(self, default):
+        self.choices = (default,)
+        self.current = {}
+        self.data = {}
+        self.key = ""
+        self.list = [default]
+        self.offset = {}
+
+
 class App(EasyGUI):
     # Composition tag(s)
     DEFAULT_NAME = "None"
@@ -84,6 +137,78 @@ class App(EasyGUI):
     SPEED_SCALE_MIN = 0
     SPEED_SCALE_MAX = 12
 
+    # Maximum number of composited spritesheets to keep
+    COMPOSITE_CACHE_SIZE = 16
+
+    # Animation polling interval while preview is hidden (milliseconds)
+    HIDDEN_ANIMATE_DELAY = 500
+
+    # Labels: (parent frame, tag, sticky, format arguments)
+    LABEL_SPECS = (
+        ("b-y1x0", "speed-anim", tk.W, (0,)),
+        ("b-y1x0", "frame-label", tk.SW, ()),
+        ("a-y1x0", "preview-frames-label", tk.W, ()),
+        ("a-y1x0", "preview-anim-label", tk.W, ()),
+        ("c-y0x0a", "offset-head", tk.W, (0, 0)),
+        ("c-y1x0a", "offset-body", tk.W, (0, 0)),
+        ("c-y1x0a", "body-x-label", tk.W, ()),
+        ("c-y1x0a", "body-y-label", tk.W, ()),
+        ("c-y0x0a", "head-x-label", tk.W, ()),
+        ("c-y0x0a", "head-y-label", tk.W, ()),
+        ("d-y1x0", "prioritize-label", tk.NS, ()),
+    )
+
+    # Radio buttons: (parent frame, tag, variable, value, selected, frame)
+    RADIO_SPECS = (
+        ("d-y1x0", "prioritize-1", "prioritize", "Head", True, None),
+        ("d-y1x0", "prioritize-2", "prioritize", "Body", False, None),
+        ("c-y7x0", "frame-0", "frame", "0", True, 0),
+        ("c-y7x0", "frame-1", "frame", "1", False, 1),
+        ("c-y7x0", "frame-2", "frame", "2", False, 2),
+        ("c-y7x0", "frame-3", "frame", "3", False, 3),
+    )
+
+    # Tags of preview buttons, keyed by state
+    PREVIEW_BUTTONS = {
+        "idle":  "preview-idle-button",
+        "left":  "preview-left-button",
+        "right": "preview-right-button",
+    }
+
+    # Next (frame, forward) after one step from (frame, forward, pingpong)
+    FRAME_STEPS = {
+        (0, True, False):  (1, True),
+        (1, True, False):  (2, True),
+        (2, True, False):  (3, True),
+        (3, True, False):  (0, True),
+        (0, True, True):   (1, True),
+        (1, True, True):   (2, True),
+        (2, True, True):   (3, True),
+        (3, True, True):   (2, False),
+        (0, False, True):  (1, True),
+        (1, False, True):  (0, False),
+        (2, False, True):  (1, False),
+        (3, False, True):  (2, False),
+    }
+
+    # Tags of per-frame radio buttons, indexed by frame
+    FRAME_RADIOS = ("frame-0", "frame-1", "frame-2", "frame-3")
+
+    # Per-frame offset readouts
+    OFFSET_FORMAT = "%+d".__mod__
+    OFFSET_ZERO = OFFSET_FORMAT(0)
+    OFFSET_VARS = {
+        "head": ("head-x", "head-y"),
+        "body": ("body-x", "body-y"),
+    }
+    SIZE_VARS = {
+        "head": "head-size",
+        "body": "body-size",
+    }
+
+    # Tags of main menu bar cascades, in menu bar order
+    MENU_TAGS = ("profile-menu", "head-menu", "body-menu", "export-menu")
+
     @property
     def colors(self) -> dict:
         return {
@@ -525,6 +650,27 @@ class App(EasyGUI):
         """
         return minutes * 60 * 1000
 
+    def draw_image(self, tag, image) -> None:
+        """
+        Draws an image to a given canvas. Each canvas holds a single image
+        item, which is created on first draw and reused afterward.
+
+        :param tag:   Tag of canvas to modify.
+        :param image: Tkinter PhotoImage to display.
+
+        :return: None.
+        """
+        canvas = self._Canvases[tag]
+        item = self._CanvasImages.get(tag, None)
+        if item is None:
+            self._CanvasImages[tag] = canvas.create_image(
+                (16, 16),
+                anchor=tk.NW,
+                image=image,
+            )
+        else:
+            canvas.itemconfigure(item, image=image)
+
     def draw_text(self, canvas: tk.Canvas, x: int, y: int, text: str) -> None:
         """
         Draws text to a given canvas.
@@ -551,6 +697,8 @@ class App(EasyGUI):
 
         :return: None.
         """
+        import psutil
+
         found = False
         zombie = False
 
@@ -589,34 +737,38 @@ class App(EasyGUI):
         # Pre-initialization processing:
 
         # Initialize animation data
-        self._Animation = {
-            "image":   None,
-            "init":    False,
-            "forward": True,
-            "playing": False,
-            "objects": [],
-            "frame":   0,
-            "speed":   6,
-            "state":   STATES.idle,
-        }
+        self._Animation = AnimationState()
 
         # Initialize per-frame data
         self._Data = {
             "profile": "",
-            "body":    {
-                "current": {},
-                "data":    {},
-                "list":    [self.DEFAULT_NAME],
-                "offset":  {},
-            },
-            "head":    {
-                "current": {},
-                "data":    {},
-                "list":    [self.DEFAULT_NAME],
-                "offset":  {},
-            },
+            "body":    SpriteData(self.DEFAULT_NAME),
+            "head":    SpriteData(self.DEFAULT_NAME),
         }
 
+        # Property tables are rebuilt on each access, so keep copies of the
+        # ones read while previewing
+        self._Colors = self.colors
+        self._Sizes = self.sizes
+
+        # Bound formatter for animation speed label
+        self._SpeedFormat = self.labels["speed-anim"].format
+
+        # Previously-composited spritesheets
+        self._Composites = {}
+
+        # Reusable preview image buffers
+        self._Buffers = {}
+
+        # Canvas image item IDs
+        self._CanvasImages = {}
+
+        # Animation frame images, allocated once and refilled per preview
+        self._AnimPhotos = []
+
+        # Last-drawn animation frame
+        self._LastAnimImage = None
+
         # Sliders
         self._ScaleAnimationRate = tk.Scale()
 
@@ -635,6 +787,14 @@ class App(EasyGUI):
         self._PendingJobs["animate"] = None
         self._PendingJobs["kill-itunes"] = None
 
+        # Cache dictionary keys whenever a selection changes
+        self.get_string_var("head").trace_add(
+            "write", lambda *_: self.update_key("head")
+        )
+        self.get_string_var("body").trace_add(
+            "write", lambda *_: self.update_key("body")
+        )
+
         # Complete widget initialization
         self.init_all_data()
         self.init_rate_slider()
@@ -673,9 +833,10 @@ class App(EasyGUI):
         query = self.messages["confirm"]["destroy"][key]
         alert = self.messages["message"]["destroy"][key]
 
-        if tk.messagebox.askquestion(title, query) == "yes":
+        if messagebox.askquestion(title, query) == "yes":
             flush_inputs(key)
-            tk.messagebox.showinfo(title, alert)
+            self._Composites.clear()
+            messagebox.showinfo(title, alert)
             return True
         else:
             return False
@@ -686,19 +847,31 @@ class App(EasyGUI):
 
         :return: True on success; False on failure.
         """
-        if self._Animation["playing"]:
+        is_playing = self._Animation.playing
+        if is_playing and not self._Canvases["preview-anim"].winfo_viewable():
+            # Preview can't be seen; check back later without drawing
+            delay = App.HIDDEN_ANIMATE_DELAY
+            self.cancel_pending("animate")
+            self.set_pending("animate", self.do_animate, delay)
+            return False
+
+        if is_playing:
             if update:
                 self.update_current_frame(1)
             else:
                 self.update_current_frame(0)
 
-            self.cancel_pending("animate")
-            self.schedule_animate()
-
         self.update_offset_labels()
         self.update_animation_image()
         self.select_anim_radiobutton()
 
+        # Flush all pending redraws in a single pass
+        self.update_idletasks()
+
+        if is_playing:
+            self.cancel_pending("animate")
+            self.schedule_animate()
+
         return True
 
     def do_composite(self, callback, **kwargs) -> tuple:
@@ -720,17 +893,17 @@ class App(EasyGUI):
             body = self.get_key("body")
             image = callback(profile, head, body, **kwargs)
 
-        except sprite_splitter.NonexistentHeadException as e:
+        except NonexistentHeadException as e:
             # Head spritesheet does not exist
             title = self.title
             alert: str = self.messages["message"]["invalid"]["head"]
-            tk.messagebox.showinfo(title, alert.format(e.filename))
+            messagebox.showinfo(title, alert.format(e.filename))
 
-        except sprite_splitter.NonexistentBodyException as e:
+        except NonexistentBodyException as e:
             # Body spritesheet does not exist
             title = self.title
             alert: str = self.messages["message"]["invalid"]["body"]
-            tk.messagebox.showinfo(title, alert.format(e.filename))
+            messagebox.showinfo(title, alert.format(e.filename))
 
         except cv2.error:
             # CV2 image processing error
@@ -774,7 +947,7 @@ class App(EasyGUI):
                     sprite_splitter.save_image(image, path)
                     title = self.title
                     alert = message.format(os.path.basename(path))
-                    tk.messagebox.showinfo(title, alert)
+                    messagebox.showinfo(title, alert)
 
             return True
 
@@ -782,7 +955,7 @@ class App(EasyGUI):
             # Image format not recognized
             title = self.title
             alert = self.messages["message"]["failure"]["type"]
-            tk.messagebox.showinfo(title, alert)
+            messagebox.showinfo(title, alert)
             return False
 
         except EmptyFilenameException:
@@ -800,18 +973,10 @@ class App(EasyGUI):
         self.turn_playback_off()
 
         callback = sprite_splitter.composite
-        state = state or str(self._Animation["state"])
-        color = self.colors["preview-static"]["bg"]
-        headfirst = self.get_string_var("prioritize").get() == "Head"
-        reverse = self.get_boolean_var("reverse-layers").get()
+        state = state or str(self._Animation.state)
+        color = self._Colors["preview-static"]["bg"]
 
-        self.make_preview(
-            callback,
-            state,
-            color=color,
-            headfirst=headfirst,
-            reverse=reverse,
-        )
+        self.make_preview(callback, state, color=color, **self.get_layering())
 
         return True
 
@@ -823,8 +988,8 @@ class App(EasyGUI):
         """
         self.cancel_pending("animate")
 
-        if self._Animation["objects"]:
-            self._Animation["playing"] = False
+        if self._Animation.objects:
+            self._Animation.playing = False
             self.do_press_button("pause-button")
             self.do_unpress_button("play-button")
 
@@ -836,8 +1001,9 @@ class App(EasyGUI):
 
         :return: True on success; False on failure.
         """
-        if self._Animation["objects"]:
-            self._Animation["playing"] = True
+        if self._Animation.objects:
+            self._Animation.playing = True
+            self._Animation.tick = time.monotonic()
             self.do_press_button("play-button")
             self.do_unpress_button("pause-button")
             self.do_animate(False)
@@ -854,8 +1020,8 @@ class App(EasyGUI):
         """
         create_input_json(key, self._Data["profile"])
         self.init_data(key)
-        self.init_option_menu(
-            self.get_frame("b-y1x0"), key, self._Data[key]["list"],
+        self.rebuild_option_menu(
+            self.get_frame("b-y1x0"), key, self._Data[key].list,
         )
 
         return True
@@ -868,7 +1034,8 @@ class App(EasyGUI):
 
         :return: True.
         """
-        self._Data[key]["offset"] = load_offsets(key, self._Data["profile"])
+        self._Data[key].offset = load_offsets(key, self._Data["profile"])
+        self._Composites.clear()
         self.update_offset_labels()
         self.do_make_preview()
 
@@ -882,13 +1049,13 @@ class App(EasyGUI):
 
         :return: True.
         """
-        frame = self._Animation["frame"] + skip
+        frame = self._Animation.frame + skip
         if frame < 0:
             frame = 3
         elif frame >= 4:
             frame = 0
 
-        self._Animation["frame"] = frame
+        self._Animation.frame = frame
         self.select_anim_radiobutton()
 
         return True
@@ -921,15 +1088,12 @@ class App(EasyGUI):
             message = self.messages["message"]["success"]["full"]
 
         callback = sprite_splitter.composite
-        reverse = self.get_boolean_var("reverse-layers").get()
-        headfirst = self.get_string_var("prioritize").get() == "Head"
 
         self.do_export(
             callback,
             message,
-            headfirst=headfirst,
-            reverse=reverse,
             idle_only=idle_only,
+            **self.get_layering(),
         )
 
         return True
@@ -944,7 +1108,7 @@ class App(EasyGUI):
 
         :return: True.
         """
-        if self._Animation["objects"]:
+        if self._Animation.objects:
             self.do_pause()
             self.do_skip_frame(skip)
             self.update_offset_labels()
@@ -952,6 +1116,61 @@ class App(EasyGUI):
 
         return True
 
+    def get_buffer(self, key, shape) -> np.ndarray:
+        """
+        Safely retrieves a reusable image buffer. Allocates one at the given
+        key if it doesn't exist yet or its shape has changed.
+
+        :param key:   Key of buffer to return.
+        :param shape: Required (height, width, channels) of buffer.
+
+        :return: Numpy image array.
+        """
+        buffer = self._Buffers.get(key, None)
+        if buffer is None or buffer.shape != shape:
+            buffer = self._Buffers[key] = np.empty(shape, np.uint8)
+        return buffer
+
+    def get_composite(self, callback, **kwargs) -> tuple:
+        """
+        Performs image composition, reusing the result of any previous call
+        made with the same profile, selection, and arguments.
+
+        :param callback: Compositing function (CompositeIdle or CompositeFull)
+
+        :return: Tuple of head key, body key, and numpy image.
+        """
+        composites = self._Composites
+        key = (
+            callback,
+            self._Data["profile"],
+            self.get_key("head"),
+            self.get_key("body"),
+            repr(sorted(kwargs.items())),
+        )
+
+        try:
+            return composites[key]
+        except KeyError:
+            result = self.do_composite(callback, **kwargs)
+            if result[2] is not None:
+                # Evict oldest entry once full
+                if len(composites) >= App.COMPOSITE_CACHE_SIZE:
+                    del composites[next(iter(composites))]
+                composites[key] = result
+            return result
+
+    def get_layering(self) -> dict:
+        """
+        Gets currently-selected layering options.
+
+        :return: Dictionary of "headfirst" and "reverse" compositing flags.
+        """
+        return {
+            "headfirst": self.get_string_var("prioritize").get() == "Head",
+            "reverse":   self.get_boolean_var("reverse-layers").get(),
+        }
+
     def get_key(self, key) -> str:
         """
         Gets a dict key associated with a named body or head.
@@ -960,11 +1179,7 @@ class App(EasyGUI):
 
         :return: Name's associated dictionary key.
         """
-        name = self.get_string_var(key).get()
-        if name != self.DEFAULT_NAME:
-            return self._Data[key].get("data", {}).get(name, "")
-        else:
-            return ""
+        return self._Data[key].key
 
     def init_all_buttons(self) -> bool:
         """
@@ -1056,13 +1271,7 @@ class App(EasyGUI):
         init_button(
             get_frame("d-y0x0"),
             "preview-idle-button",
-            thread_it(
-                lambda: self.do_make_preview(state="idle")
-                        and self.do_press_button("preview-idle-button")
-                        and self.do_unpress_button("preview-left-button")
-                        and self.do_unpress_button("preview-right-button")
-                        and self.jump_frame(0)
-            ),
+            thread_it(lambda: self.select_preview("idle")),
             pressed=True,
         )
 
@@ -1070,26 +1279,14 @@ class App(EasyGUI):
         init_button(
             get_frame("d-y0x0"),
             "preview-left-button",
-            thread_it(
-                lambda: self.do_make_preview(state="left")
-                        and self.do_press_button("preview-left-button")
-                        and self.do_unpress_button("preview-idle-button")
-                        and self.do_unpress_button("preview-right-button")
-                        and self.jump_frame(0)
-            ),
+            thread_it(lambda: self.select_preview("left")),
         )
 
         # Initialize "right preview" button
         init_button(
             get_frame("d-y0x0"),
             "preview-right-button",
-            thread_it(
-                lambda: self.do_make_preview(state="right")
-                        and self.do_press_button("preview-right-button")
-                        and self.do_unpress_button("preview-left-button")
-                        and self.do_unpress_button("preview-idle-button")
-                        and self.jump_frame(0)
-            ),
+            thread_it(lambda: self.select_preview("right")),
         )
 
         # Initialize "ping-pong" button
@@ -1114,19 +1311,13 @@ class App(EasyGUI):
 
         :return: True on success; False on failure.
         """
+        border = self.sizes["CANVAS_BORDERS"]
+
         # Initialize "static preview" canvas
-        self.init_canvas(
-            self.get_frame("a-y1x0"),
-            "preview-static",
-            self.sizes["CANVAS_BORDERS"],
-        )
+        self.init_canvas(self.get_frame("a-y1x0"), "preview-static", border)
 
         # Initialize "animated preview" canvas
-        self.init_canvas(
-            self.get_frame("a-y1x0"),
-            "preview-anim",
-            self.sizes["CANVAS_BORDERS"],
-        )
+        self.init_canvas(self.get_frame("a-y1x0"), "preview-anim", border)
 
         self.draw_text(
             self.get_canvas("preview-static"), 24, 24,
@@ -1257,103 +1448,116 @@ class App(EasyGUI):
 
         :return: True on success; False on failure.
         """
-        # Initialize "animation speed" label
-        self.init_label(
-            self.get_frame("b-y1x0"),
-            "speed-anim",
-            ("calibri", self.sizes["FONTSIZE_SMALL"]),
-            tk.W, 0,
-        )
+        get_frame = self.get_frame
+        init_label = self.init_label
+        font = ("calibri", self.sizes["FONTSIZE_SMALL"])
 
-        # Initialize "current frame" label
-        self.init_label(
-            self.get_frame("b-y1x0"),
-            "frame-label",
-            ("calibri", self.sizes["FONTSIZE_SMALL"]),
-            tk.SW,
-        )
+        for frame, tag, sticky, args in App.LABEL_SPECS:
+            init_label(get_frame(frame), tag, font, sticky, *args)
 
-        # Initialize "static frames preview" label
-        self.init_label(
-            self.get_frame("a-y1x0"),
-            "preview-frames-label",
-            ("calibri", self.sizes["FONTSIZE_SMALL"]),
-            tk.W,
-        )
+        return True
 
-        # Initialize "animated preview" label
-        self.init_label(
-            self._Frames["a-y1x0"],
-            "preview-anim-label",
-            ("calibri", self.sizes["FONTSIZE_SMALL"]),
-            tk.W,
-        )
+    def init_all_menus(self) -> bool:
+        """
+        Initializes all required menus. The menu bar and its cascades are
+        attached right away, so the window doesn't resize once shown; their
+        entries are filled in on the first idle tick.
 
-        # Initialize "head offset" label
-        self.init_label(
-            self._Frames["c-y0x0a"],
-            "offset-head",
-            ("calibri", self.sizes["FONTSIZE_SMALL"]),
-            tk.W, 0, 0,
-        )
+        :return: True.
+        """
+        # Initialize main menu bar
+        root_menu = self._Menus["main-menu"]
+        self._Master.config(menu=root_menu)
 
-        # Initialize "body offset" label
-        self.init_label(
-            self._Frames["c-y1x0a"],
-            "offset-body",
-            ("calibri", self.sizes["FONTSIZE_SMALL"]),
-            tk.W,
-            0, 0,
-        )
+        # Initialize empty cascades, in menu bar order
+        for tag in App.MENU_TAGS:
+            self.init_menu(root_menu, tag)
 
-        # Initialize "body x-coordinate" label
-        self.init_label(
-            self._Frames["c-y1x0a"],
-            "body-x-label",
-            ("calibri", self.sizes["FONTSIZE_SMALL"]),
-            tk.W,
-        )
-        # Initialize "body y-coordinate" label
-        self.init_label(
-            self._Frames["c-y1x0a"],
-            "body-y-label",
-            ("calibri", self.sizes["FONTSIZE_SMALL"]),
-            tk.W,
-        )
-        # Initialize "head x-coordinate" label
-        self.init_label(
-            self._Frames["c-y0x0a"],
-            "head-x-label",
-            ("calibri", self.sizes["FONTSIZE_SMALL"]),
-            tk.W,
-        )
-        # Initialize "head y-coordinate" label
-        self.init_label(
-            self._Frames["c-y0x0a"],
-            "head-y-label",
-            ("calibri", self.sizes["FONTSIZE_SMALL"]),
-            tk.W,
-        )
+        self.after_idle(self.init_menu_bar)
 
-        # Initialize "prioritize" label
-        self.init_label(
-            self._Frames["d-y1x0"],
-            "prioritize-label",
-            ("calibri", self.sizes["FONTSIZE_SMALL"]),
-            tk.NS,
-        )
+        return True
+
+    def init_all_optionmenus(self) -> bool:
+        """
+        Initializes all required option menus.
+
+        :return: True.
+        """
+        init_optionmenu = self.init_option_menu
+        frames = self._Frames
+        data = self._Data
+
+        # Initialize "select head" dropdown menu
+        init_optionmenu(frames["b-y1x0"], "head", data["head"].list)
+
+        # Initialize "select body" dropdown menu
+        init_optionmenu(frames["b-y1x0"], "body", data["body"].list)
 
         return True
 
-    def init_all_menus(self) -> bool:
+    def init_all_radiobuttons(self) -> bool:
         """
-        Initializes all required menus.
+        Initializes all required radio buttons.
 
         :return: True.
         """
-        # Initialize main menu bar
-        self._Master.config(menu=self._Menus["main-menu"])
+        init_radio = self.init_radio
+        get_frame = self.get_frame
+        get_string_var = self.get_string_var
+        thread_it = self.thread_it
 
+        for frame, tag, var, value, select, jump in App.RADIO_SPECS:
+            if jump is None:
+                command = None
+            else:
+                command = thread_it(lambda n=jump: self.jump_frame(n))
+
+            init_radio(
+                get_frame(frame),
+                tag,
+                get_string_var(var),
+                value,
+                tk.W,
+                select=select,
+                command=command,
+            )
+
+        return True
+
+    def init_data(self, key, *, empty=False) -> bool:
+        """
+        Completes initialization of data from file.
+
+        :param key:   Either of "head" or "body".
+        :param empty: Whether to keep field empty. (Default False).
+
+        :return: True.
+        """
+        paths = load_paths(key)
+        data = self._Data
+        offsets = load_offsets(key, data["profile"])
+
+        names = data[key].data = {
+            v.get("name", "---"): k for k, v in paths.items()
+        }
+
+        data[key].list = [self.DEFAULT_NAME]
+        if not empty:
+            data[key].list += sorted(list(names))
+        data[key].choices = tuple(data[key].list)
+
+        data[key].offset = offsets
+        self.update_key(key)
+        self._Composites.clear()
+
+        return True
+
+    def init_menu_bar(self) -> bool:
+        """
+        Completes initialization of main menu bar entries.
+
+        :return: True.
+        """
         thread_it = self.thread_it
         init_menu = self.init_menu
         labels = self.labels
@@ -1439,130 +1643,19 @@ class App(EasyGUI):
 
         return True
 
-    def init_all_optionmenus(self) -> bool:
-        """
-        Initializes all required option menus.
-
-        :return: True.
-        """
-        init_optionmenu = self.init_option_menu
-        frames = self._Frames
-        data = self._Data
-
-        # Initialize "select head" dropdown menu
-        init_optionmenu(frames["b-y1x0"], "head", data["head"]["list"])
-
-        # Initialize "select body" dropdown menu
-        init_optionmenu(frames["b-y1x0"], "body", data["body"]["list"])
-
-        return True
-
-    def init_all_radiobuttons(self) -> bool:
-        """
-        Initializes all required radio buttons.
-
-        :return: True.
-        """
-        init_radio = self.init_radio
-        get_string_var = self.get_string_var
-        thread_it = self.thread_it
-        frames = self._Frames
-
-        # Initialize "prioritize head" radio button
-        init_radio(
-            frames["d-y1x0"],
-            "prioritize-1",
-            get_string_var("prioritize"),
-            "Head",
-            tk.W,
-            select=True,
-        )
-
-        # Initialize "prioritize body" radio button
-        init_radio(
-            frames["d-y1x0"],
-            "prioritize-2",
-            get_string_var("prioritize"),
-            "Body",
-            tk.W,
-        )
-
-        # Initialize "frame #1" radio button
-        init_radio(
-            frames["c-y7x0"],
-            "frame-0",
-            get_string_var("frame"),
-            "0",
-            tk.W,
-            select=True,
-            command=thread_it(lambda: self.jump_frame(0)),
-        )
-
-        # Initialize "frame #2" radio button
-        init_radio(
-            self._Frames["c-y7x0"],
-            "frame-1",
-            get_string_var("frame"),
-            "1",
-            tk.W,
-            command=thread_it(lambda: self.jump_frame(1)),
-        )
-
-        # Initialize "frame #3" radio button
-        init_radio(
-            frames["c-y7x0"],
-            "frame-2",
-            get_string_var("frame"),
-            "2",
-            tk.W,
-            command=thread_it(lambda: self.jump_frame(2)),
-        )
-
-        # Initialize "frame #4" radio button
-        init_radio(
-            frames["c-y7x0"],
-            "frame-3",
-            get_string_var("frame"),
-            "3",
-            tk.W,
-            command=thread_it(lambda: self.jump_frame(3)),
-        )
-
-        return True
-
-    def init_data(self, key, *, empty=False) -> bool:
-        """
-        Completes initialization of data from file.
-
-        :param key:   Either of "head" or "body".
-        :param empty: Whether to keep field empty. (Default False).
-
-        :return: True.
-        """
-        paths = load_paths(key)
-        data = self._Data
-        offsets = load_offsets(key, data["profile"])
-
-        names = data[key]["data"] = {
-            v.get("name", "---"): k for k, v in paths.items()
-        }
-
-        data[key]["list"] = [self.DEFAULT_NAME]
-        if not empty:
-            data[key]["list"] += sorted(list(names))
-
-        data[key]["offset"] = offsets
-
-        return True
-
     def init_rate_slider(self) -> bool:
         """
         Completes initialization of framerate slider.
 
         :return: True.
         """
-        scale = tk.Scale(
-            self._Frames["c-y0x0b"],
+        master = self._Frames["c-y0x0b"]
+        scale = self._ScaleAnimationRate
+        if not isinstance(scale, tk.Scale) or scale.master is not master:
+            scale.destroy()
+            scale = tk.Scale(master)
+
+        scale.config(
             from_=self.SPEED_SCALE_MAX,
             to=self.SPEED_SCALE_MIN,
             orient=tk.VERTICAL,
@@ -1571,7 +1664,9 @@ class App(EasyGUI):
             command=self.update_speed,
         )
 
-        scale.set(self._Animation["speed"])
+        speed = self._Animation.speed
+        scale.set(speed)
+        self.set_label_text("speed-anim", self._SpeedFormat(speed))
 
         scale.grid(
             row=self.grid["speed-slider"][0],
@@ -1581,7 +1676,6 @@ class App(EasyGUI):
             pady=4,
         )
 
-        self._ScaleAnimationRate.destroy()
         self._ScaleAnimationRate = scale
 
         return True
@@ -1594,8 +1688,8 @@ class App(EasyGUI):
 
         :return: True.
         """
-        self._Animation["playing"] = False
-        self._Animation["frame"] = frame
+        self._Animation.playing = False
+        self._Animation.frame = frame
 
         self.do_press_button("pause-button")
         self.do_unpress_button("play-button")
@@ -1618,25 +1712,26 @@ class App(EasyGUI):
         animation = self._Animation
 
         # Get animation frames
-        w, h = self.sizes["preview-anim"]
-        animation["objects"] = [
-            sprite_imaging.ToPILToTkinter(
-                sprite_imaging.Crop(image, [w * n, 0], [w, h])
-            ) for n in range(4)
-        ]
+        w, h = self._Sizes["preview-anim"]
+        photos = self._AnimPhotos
+        if not photos:
+            photos = self._AnimPhotos = [
+                sprite_imaging.MakeTkinter(w, h) for _ in range(4)
+            ]
+
+        for n, photo in enumerate(photos):
+            sprite_imaging.PasteTkinter(photo, image[:h, w * n:w * (n + 1)])
+        animation.objects = photos
 
         # Reset animation counters
         if reset:
-            animation["frame"] = 0
-            animation["forward"] = True
-        animation["speed"] = self._ScaleAnimationRate.get()
+            animation.frame = 0
+            animation.forward = True
+        animation.speed = self._ScaleAnimationRate.get()
 
         # Create animated preview
-        self._Canvases["preview-anim"].create_image(
-            (16, 16),
-            anchor=tk.NW,
-            image=animation["objects"][0],
-        )
+        self.draw_image("preview-anim", animation.objects[0])
+        self._LastAnimImage = animation.objects[0]
 
         # Update labels
         self.update_offset_labels()
@@ -1653,12 +1748,8 @@ class App(EasyGUI):
         """
         # Paste image onto canvas
         image = sprite_imaging.ToTkinter(sprite_imaging.ToPIL(image))
-        self._Animation["image"] = image
-        self._Canvases["preview-static"].create_image(
-            (16, 16),
-            anchor=tk.NW,
-            image=image,
-        )
+        self._Animation.image = image
+        self.draw_image("preview-static", image)
 
         # self.DrawFrameLabels()
 
@@ -1676,26 +1767,26 @@ class App(EasyGUI):
         """
         try:
             data = self._Data
-            profile = data["profile"]
 
-            # Perform sprite composition
-            self._Animation["state"] = state
-            data["head"]["offset"] = load_offsets("head", profile)
+            # Perform sprite composition. Offsets are loaded by init_data and
+            # reloaded by do_remake_offset, so they aren't reread here
+            self._Animation.state = state
 
-            head, body, image = self.do_composite(func, **kwargs)
+            head, body, image = self.get_composite(func, **kwargs)
             if image is not None:
                 try:
-                    # Crop idle frames from source spritesheet
+                    # Crop idle frames from source spritesheet. The preview
+                    # is an upscale, so swap channels before resizing
+                    x, y, w, h = App.RECTS[state]
+                    rw, rh = self._Sizes["preview-resize"]
                     image = cv2.resize(
                         cv2.cvtColor(
-                            sprite_imaging.Crop(
-                                image,
-                                App.RECTS[state][0:2],
-                                App.RECTS[state][2:4],
-                            ),
+                            sprite_imaging.Crop(image, [x, y], [w, h]),
                             cv2.COLOR_BGR2RGB,
+                            dst=self.get_buffer("preview-crop", (h, w, 3)),
                         ),
-                        dsize=tuple(self.sizes["preview-resize"]),
+                        dsize=(rw, rh),
+                        dst=self.get_buffer("preview-resize", (rh, rw, 3)),
                         interpolation=cv2.INTER_NEAREST,
                     )
 
@@ -1703,17 +1794,9 @@ class App(EasyGUI):
                     self.make_animation_preview(image)
                     self.make_animation_frames(image, reset)
 
-                    try:
-                        # Populate per-frame head offset data
-                        data["head"]["current"] = data["head"]["offset"][body]
-                    except KeyError:
-                        data["head"]["current"] = {}
-
-                    try:
-                        # Populate per-frame body offset data
-                        data["body"]["current"] = data["body"]["offset"][body]
-                    except KeyError:
-                        data["body"]["current"] = {}
+                    # Populate per-frame head and body offset data
+                    data["head"].current = data["head"].offset.get(body, {})
+                    data["body"].current = data["body"].offset.get(body, {})
 
                     self.update_offset_labels()
 
@@ -1724,7 +1807,7 @@ class App(EasyGUI):
             # Image format not recognized
             title = self.title
             message = self.messages["message"]["failure"]["type"]
-            tk.messagebox.showinfo(title, message)
+            messagebox.showinfo(title, message)
 
         return True
 
@@ -1740,9 +1823,9 @@ class App(EasyGUI):
         query = self.messages["confirm"]["rebuild"]["data"][key]
         alert = self.messages["message"]["rebuild"]["data"][key]
 
-        if tk.messagebox.askquestion(title, query) == "yes":
+        if messagebox.askquestion(title, query) == "yes":
             self.do_rebuild_data(key)
-            tk.messagebox.showinfo(title, alert)
+            messagebox.showinfo(title, alert)
 
         return True
 
@@ -1758,9 +1841,10 @@ class App(EasyGUI):
         query = self.messages["confirm"]["rebuild"]["image"][key]
         alert = self.messages["message"]["rebuild"]["image"][key]
 
-        if tk.messagebox.askquestion(title, query) == "yes":
-            prepare(key, self._Data["profile"])
-            tk.messagebox.showinfo(title, alert)
+        if messagebox.askquestion(title, query) == "yes":
+            prepare(key, self._Data["profile"], force=True)
+            self._Composites.clear()
+            messagebox.showinfo(title, alert)
 
         return True
 
@@ -1776,9 +1860,9 @@ class App(EasyGUI):
         query = self.messages["confirm"]["rebuild"]["offset"][key]
         alert = self.messages["message"]["rebuild"]["offset"][key]
 
-        if tk.messagebox.askquestion(title, query) == "yes":
+        if messagebox.askquestion(title, query) == "yes":
             self.do_remake_offset(key)
-            tk.messagebox.showinfo(title, alert)
+            messagebox.showinfo(title, alert)
 
         return True
 
@@ -1788,9 +1872,14 @@ class App(EasyGUI):
 
         :return: True.
         """
-        speed = self._Animation["speed"]
+        animation = self._Animation
+        speed = animation.speed
         if speed > 0:
-            self.set_pending("animate", self.do_animate, 1000 // speed)
+            # Aim for an absolute deadline so per-tick work doesn't add drift
+            now = time.monotonic()
+            animation.tick = max(animation.tick + 1 / speed, now)
+            delay = int((animation.tick - now) * 1000)
+            self.set_pending("animate", self.do_animate, delay)
         return True
 
     def select_anim_radiobutton(self) -> bool:
@@ -1799,11 +1888,27 @@ class App(EasyGUI):
 
         :return: True.
         """
-        frame = self._Animation["frame"]
-        buttons = self._RadioButtons
-        toggle = self.toggle_radio
-        for n in range(4):
-            toggle(buttons["frame-{}".format(n)], n == frame)
+        # Radio buttons share a variable, so selecting one clears the rest
+        tag = App.FRAME_RADIOS[self._Animation.frame]
+        self._RadioButtons[tag].select()
+        return True
+
+    def select_preview(self, state) -> bool:
+        """
+        Previews a sprite state and presses its corresponding button.
+
+        :param state: Named state to preview.
+
+        :return: True.
+        """
+        self.do_make_preview(state=state)
+        for k, tag in App.PREVIEW_BUTTONS.items():
+            if k == state:
+                self.do_press_button(tag)
+            else:
+                self.do_unpress_button(tag)
+        self.jump_frame(0)
+
         return True
 
     def set_profile(self, profile) -> bool:
@@ -1835,8 +1940,9 @@ class App(EasyGUI):
 
         :return: True.
         """
-        self.shuffle_body()
-        self.shuffle_head()
+        data = self._Data
+        self.get_string_var("body").set(random.choice(data["body"].choices))
+        self.get_string_var("head").set(random.choice(data["head"].choices))
         self.do_make_preview()
 
         return True
@@ -1847,9 +1953,8 @@ class App(EasyGUI):
 
         :return: True.
         """
-        self.get_string_var("body").set(
-            random.choice(self._Data["body"]["list"])
-        )
+        choices = self._Data["body"].choices
+        self.get_string_var("body").set(random.choice(choices))
         self.do_make_preview()
 
         return True
@@ -1860,9 +1965,8 @@ class App(EasyGUI):
 
         :return: True.
         """
-        self.get_string_var("head").set(
-            random.choice(self._Data["head"]["list"])
-        )
+        choices = self._Data["head"].choices
+        self.get_string_var("head").set(random.choice(choices))
         self.do_make_preview()
 
         return True
@@ -1907,7 +2011,7 @@ class App(EasyGUI):
 
         :return: True.
         """
-        if not self._Animation["playing"]:
+        if not self._Animation.playing:
             self.do_make_preview()
             self.do_play()
 
@@ -1928,60 +2032,41 @@ class App(EasyGUI):
 
         :return: True.
         """
-        animation: dict = self._Animation
+        animation = self._Animation
         get = self.get_boolean_var
 
         # Check frame iteration type
-        is_forwards = animation["forward"]
+        is_forwards = animation.forward
         is_pingpong = get("pingpong-animation").get()
         if not is_pingpong:
             is_forwards = True
 
         # Increment frame
-        frame = animation["frame"]
-
-        if animation["objects"]:
-            if is_forwards:
-                # Forwards iteration
-                frame += increment
-                if frame < 0:
-                    if not is_pingpong:
-                        frame = 3
-                        is_forwards = True
-                    else:
-                        frame = 1
-                        is_forwards = True
-
-                elif frame >= 4:
-                    if not is_pingpong:
-                        frame = 0
-                        is_forwards = True
-                    else:
-                        frame = 2
-                        is_forwards = False
-
-            else:
-                # Backwards iteration
-                frame -= increment
-                if frame < 0:
-                    if not is_pingpong:
-                        frame = 3
-                        is_forwards = True
-                    else:
-                        frame = 1
-                        is_forwards = True
-
-                elif frame >= 4:
-                    if not is_pingpong:
-                        frame = 0
-                        is_forwards = True
-                    else:
-                        frame = 2
-                        is_forwards = False
+        frame = animation.frame
+        if animation.objects and increment:
+            frame, is_forwards = App.FRAME_STEPS[
+                frame, is_forwards, is_pingpong
+            ]
 
         # Update references to current frame
-        animation["forward"] = is_forwards
-        animation["frame"] = frame
+        animation.forward = is_forwards
+        animation.frame = frame
+
+        return True
+
+    def update_key(self, key) -> bool:
+        """
+        Caches the dict key associated with the currently-selected name.
+
+        :param key: Either of "body" or "head".
+
+        :return: True.
+        """
+        name = self.get_string_var(key).get()
+        if name != self.DEFAULT_NAME:
+            self._Data[key].key = self._Data[key].data.get(name, "")
+        else:
+            self._Data[key].key = ""
 
         return True
 
@@ -1995,19 +2080,20 @@ class App(EasyGUI):
 
         :return: True.
         """
-        var_x: str = "{}-x".format(key)
-        var_y: str = "{}-y".format(key)
+        var_x, var_y = App.OFFSET_VARS[key]
         data: dict = self._Data
-        get = self.get_string_var
+        put = self.set_string_var
+        fmt = App.OFFSET_FORMAT
 
-        try:
-            xy = data[key]["current"]["offset"][state][frame]
-            get(var_x).set("{0:+d}".format(xy[0]))
-            get(var_y).set("{0:+d}".format(xy[1]))
+        offsets = data[key].current.get("offset", {}).get(state, ())
+        if frame < len(offsets):
+            xy = offsets[frame]
+            put(var_x, fmt(xy[0]))
+            put(var_y, fmt(xy[1]))
 
-        except (KeyError, IndexError):
-            get(var_x).set("{0:+d}".format(0))
-            get(var_y).set("{0:+d}".format(0))
+        else:
+            put(var_x, App.OFFSET_ZERO)
+            put(var_y, App.OFFSET_ZERO)
 
         return True
 
@@ -2019,16 +2105,16 @@ class App(EasyGUI):
 
         :return: True.
         """
-        var: str = "{}-size".format(key)
+        var: str = App.SIZE_VARS[key]
         data: dict = self._Data
-        get = self.get_string_var
+        put = self.set_string_var
 
-        try:
-            size = data[key]["current"]["size"]
-            get(var).set(size.capitalize())
+        size = data[key].current.get("size", None)
+        if size is not None:
+            put(var, size.capitalize())
 
-        except (KeyError, IndexError):
-            get(var).set("Large")
+        else:
+            put(var, "Large")
 
         return True
 
@@ -2039,18 +2125,16 @@ class App(EasyGUI):
         :return: True.
         """
         animation = self._Animation
-        canvases = self._Canvases
         try:
             # Draw frame to canvas
-            anim_objects = animation["objects"]
-            anim_frame = animation["frame"]
+            anim_objects = animation.objects
+            anim_frame = animation.frame
             anim_image = anim_objects[anim_frame]
 
-            canvases["preview-anim"].create_image(
-                (16, 16),
-                anchor=tk.NW,
-                image=anim_image,
-            )
+            # Skip redraw if frame is already displayed
+            if anim_image is not self._LastAnimImage:
+                self.draw_image("preview-anim", anim_image)
+                self._LastAnimImage = anim_image
 
         except IndexError:
             # Current frame is invalid
@@ -2068,8 +2152,8 @@ class App(EasyGUI):
         update_offset_label = self.update_offset_label
         update_size_label = self.update_size_label
 
-        state = animation["state"]
-        frame = animation["frame"]
+        state = animation.state
+        frame = animation.frame
 
         update_offset_label("head", state, frame)
         update_offset_label("body", state, frame)
@@ -2086,10 +2170,15 @@ class App(EasyGUI):
         :return: True.
         """
         speed = int(speed)
-        text = self.labels["speed-anim"].format(speed)
+        if speed == self._Animation.speed:
+            # Slider moved within the same integer value
+            return True
+
+        text = self._SpeedFormat(speed)
 
-        self._Labels["speed-anim"].config(text=text)
-        self._Animation["speed"] = speed
+        self.set_label_text("speed-anim", text)
+        self._Animation.speed = speed
+        self._Animation.tick = time.monotonic()
 
         # Play animation
         self.cancel_pending("animate")
@@ -7,7 +7,9 @@ General image processing functions.
 
 """
 import cv2
+import functools
 import numpy as np
+import os
 from PIL import Image, ImageTk
 
 
@@ -33,8 +35,11 @@ def ConvertAlpha(image):
 
     :return: Image with alpha channel added.
     """
-    b, g, r = cv2.split(image)
-    return cv2.merge((b, g, r, np.ones(b.shape, dtype=b.dtype) * 255))
+    h, w, _ = image.shape
+    outImage = np.empty((h, w, 4), dtype=image.dtype)
+    outImage[:, :, :3] = image
+    outImage[:, :, 3] = 255
+    return outImage
 
 
 def Crop(image, start, size):
@@ -61,6 +66,10 @@ def GetUniqueColors(image: np.ndarray) -> np.ndarray:
 
     :return: Numpy array containing all unique colors within image.
     """
+    if image.dtype == np.uint8:
+        # Count each possible byte value instead of sorting every pixel
+        counts = np.bincount(image.ravel(), minlength=256)
+        return np.flatnonzero(counts).astype(np.uint8)
     return np.unique(image)
 
 
@@ -73,17 +82,17 @@ def ToGrayscale(image, is_color=False):
 
     :return: Image as converted to grayscale.
     """
-    try:
-        outImage = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-        outImage = cv2.cvtColor(outImage, cv2.COLOR_BGR2GRAY)
+    if not image.size or image.ndim != 3 or image.shape[2] not in (3, 4):
+        # Empty or not a color image
+        return image
 
-        # Optionally output as RGB again
-        if is_color:
-            outImage = cv2.cvtColor(outImage, cv2.COLOR_GRAY2RGB)
+    outImage = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
 
-        return outImage
-    except cv2.error:
-        return image
+    # Optionally output as RGB again
+    if is_color:
+        outImage = cv2.cvtColor(outImage, cv2.COLOR_GRAY2RGB)
+
+    return outImage
 
 
 def ToPIL(image):
@@ -108,18 +117,67 @@ def ToTkinter(image):
     return ImageTk.PhotoImage(image)
 
 
-def OpenTkinter(path, w, h):
+def OpenTkinter(path, w, h, resample=None):
     """
-    Docstring goes here.
+    Opens an image file, resized, as a Tkinter-compatible object.
 
-    :param path: Path to image file.
-    :param w:    Width of image.
-    :param h:    Height of image.
+    Results are cached until the file is modified, so repeated requests
+    share one PhotoImage.
+
+    :param path:     Path to image file.
+    :param w:        Width of image.
+    :param h:        Height of image.
+    :param resample: PIL resampling filter. (Default bilinear for sizes up
+                     to 128 pixels; Lanczos otherwise).
+
+    :return: Tkinter PhotoImage instance.
+    """
+    if resample is None:
+        resample = Image.BILINEAR if max(w, h) <= 128 else Image.LANCZOS
+    return OpenTkinterCached(path, os.stat(path).st_mtime_ns, w, h, resample)
+
+
+@functools.lru_cache(maxsize=64)
+def OpenTkinterCached(path, mtime, w, h, resample):
+    """
+    Opens an image file, resized, as a Tkinter-compatible object.
+
+    :param path:     Path to image file.
+    :param mtime:    Modification time of file. (Nanoseconds).
+    :param w:        Width of image.
+    :param h:        Height of image.
+    :param resample: PIL resampling filter.
 
     :return: Tkinter PhotoImage instance.
     """
     image = Image.open(path)
-    return ImageTk.PhotoImage(image.resize((w, h), Image.ANTIALIAS))
+    return ImageTk.PhotoImage(image.resize((w, h), resample))
+
+
+def MakeTkinter(w, h, mode="RGB"):
+    """
+    Creates a blank Tkinter-compatible image, to be filled in later.
+
+    :param w:    Width of image.
+    :param h:    Height of image.
+    :param mode: PIL image mode. (Default "RGB").
+
+    :return: PhotoImage compatible with Tkinter.
+    """
+    return ImageTk.PhotoImage(mode, (w, h), width=w, height=h)
+
+
+def PasteTkinter(photo, image):
+    """
+    Copies a numpy array into an existing Tkinter-compatible image.
+
+    :param photo: PhotoImage of the same size as image.
+    :param image: Numpy image array.
+
+    :return: The same PhotoImage.
+    """
+    photo.paste(ToPIL(image))
+    return photo
 
 
 def ToPILToTkinter(image):
@@ -156,15 +214,17 @@ def MakeBlank(w, h, channels=4, *, color=(0, 0, 0, 0)):
 
     :return: Blank CV2-ready image.
     """
-    image = np.zeros((h, w, channels), np.uint8)
     if len(color) == 4:
         fill = color[2], color[1], color[0], color[3]
     elif len(color) == 3:
         fill = color[2], color[1], color[0], 0
     else:
         fill = 0, 0, 0, 0
-    image[:, :] = fill
-    return image
+
+    if not any(fill):
+        # Zeroed memory is already the requested color
+        return np.zeros((h, w, channels), np.uint8)
+    return np.full((h, w, channels), fill, np.uint8)
 
 
 def MakeMask(image, thresh, maxval=255):
@@ -177,12 +237,30 @@ def MakeMask(image, thresh, maxval=255):
 
     :return: Newly-generated bitmask.
     """
-    image = cv2.threshold(image, thresh - 1, maxval, cv2.THRESH_TOZERO)[1]
-    image = cv2.threshold(image, thresh + 1, maxval, cv2.THRESH_TOZERO_INV)[1]
-    image = cv2.threshold(image, thresh - 1, maxval, cv2.THRESH_BINARY)[1]
-    image = cv2.threshold(image, thresh + 1, maxval, cv2.THRESH_BINARY)[1]
+    return cv2.LUT(image, MakeMaskTable(int(thresh), maxval))
+
+
+@functools.lru_cache(maxsize=256)
+def MakeMaskTable(thresh, maxval=255):
+    """
+    Creates a lookup table mapping 8-bit values to bitmask values.
+
+    Runs the threshold passes over all 256 possible values once, so that
+    masking a full image only takes a single lookup pass.
+
+    :param thresh: Transparency threshold.
+    :param maxval: Maximum threshold value. (Default 255).
 
-    return image
+    :return: 256-entry lookup table.
+    """
+    table = np.arange(256, dtype=np.uint8).reshape(1, 256)
+    table = cv2.threshold(table, thresh - 1, maxval, cv2.THRESH_TOZERO)[1]
+    table = cv2.threshold(table, thresh + 1, maxval, cv2.THRESH_TOZERO_INV)[1]
+    table = cv2.threshold(table, thresh - 1, maxval, cv2.THRESH_BINARY)[1]
+    table = cv2.threshold(table, thresh + 1, maxval, cv2.THRESH_BINARY)[1]
+    table.flags.writeable = False
+
+    return table
 
 
 def Paste(dest, src, pos):
@@ -197,24 +275,32 @@ def Paste(dest, src, pos):
 
     :return: None.
     """
+    # Clip pasted region to destination bounds
     x, y = pos
-    for yy in range(src.shape[0]):
-        for xx in range(src.shape[1]):
-            try:
-                # If alpha channel, copy if non-transparent
-                if src[yy, xx, 3]:
-                    dest[y + yy, x + xx] = src[yy, xx]
-            except IndexError:
-                # Has no alpha channel
-                try:
-                    dest[y + yy, x + xx] = src[yy, xx]
-                except IndexError:
-                    # Out of bounds
-                    pass
+    h, w = src.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, dest.shape[1]), min(y + h, dest.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        # Out of bounds
+        return
+
+    src = src[y0 - y:y1 - y, x0 - x:x1 - x]
+    region = dest[y0:y1, x0:x1]
+
+    if src.ndim == 3 and src.shape[2] >= 4:
+        # If alpha channel, copy only non-transparent pixels
+        if src.shape == region.shape and src.dtype == region.dtype:
+            # OpenCV writes through to the destination view
+            cv2.copyTo(src, np.ascontiguousarray(src[:, :, 3]), region)
+        else:
+            np.copyto(region, src, where=src[:, :, 3:4] != 0)
+    else:
+        # Has no alpha channel
+        region[...] = src
 
 
 # noinspection PyUnresolvedReferences
-def ReplaceColor(image, color=[], replace=[0, 0, 0]):
+def ReplaceColor(image, color=[], replace=[0, 0, 0], *, inplace=False):
     """
     Replaces a color in an image with another one.
 
@@ -223,17 +309,22 @@ def ReplaceColor(image, color=[], replace=[0, 0, 0]):
     :param image:   Image to modify.
     :param color:   RGB color to be replaced.
     :param replace: RGB color to replace with.
+    :param inplace: Whether to modify image instead of a copy. (Default False).
 
-    :return: Copy of image with the given color replaced.
+    :return: Image with the given color replaced.
     """
-    outImage = np.copy(image)
-
     if not color:
-        color = outImage[0, 0]
+        color = image[0, 0]
+
+    if inplace:
+        outImage = image
+    else:
+        outImage = np.copy(image)
 
-    try:
-        outImage[np.where((outImage == color).all(axis=2))] = replace
-    except AttributeError:
-        outImage[:, :] = replace
+    if outImage.size:
+        # Match all channels in a single pass, then write through the mask
+        color = np.asarray(color, dtype=outImage.dtype)
+        mask = cv2.inRange(outImage, color, color)
+        outImage[mask != 0] = replace
 
     return outImage
@@ -6,22 +6,16 @@ Fire Emblem 3DS Sprite Compositing Tool
 Utilities for reading and writing local JSON files.
 
 """
+import functools
 import json
-import glob
 from sprite_utils import *
 
+try:
+    # Faster parser for number-heavy files, if available
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
-JSON_TEMPLATES = {
-    "base": "{{{}}}",
-    "head": "\"{name}\":{{"
-            "\"path\":[\"images\",\"{profile}\",\"head\",\"{name}.png\"],"
-            "\"name\":\"{full}\""
-            "}},",
-    "body": "\"{name}\":{{"
-            "\"path\":[\"images\",\"{profile}\",\"body\",\"{name}.png\"],"
-            "\"name\":\"{full}\""
-            "}},",
-}
 
 PATHS = {
     "images": os.path.join(DIRECTORIES["input"]["root"], "images"),
@@ -55,6 +49,15 @@ JSON_KEY_RESERVE = "?.{}"
 JSON_KEY_DEFAULT = JSON_KEY_RESERVE.format("default")
 
 
+def clear_json_cache():
+    """
+    Discards all cached JSON file contents.
+
+    :return: None.
+    """
+    load_json_cached.cache_clear()
+
+
 def create_input_json(key, profile):
     """
     Automatically generates a character head or body JSON file.
@@ -66,29 +69,68 @@ def create_input_json(key, profile):
 
     :return: None.
     """
-    path = os.path.join(PATHS["images"], profile, key, "*.png")
-    contents = ""
-    for fn in sorted(glob.glob(path)):
-        n = os.path.splitext(os.path.basename(fn))[0]
-        p = " ".join([(
-            "({})".format(x.capitalize())
-            if len(x) == 1
-            else (
-                x
-                if len(x) == 2
-                else x.capitalize()
-            )
-        ) for x in n.split("-")
-        ])
-        contents += JSON_TEMPLATES[key].format(profile=profile, name=n, full=p)
-
-    contents = contents.rstrip(",")
-    contents = JSON_TEMPLATES["base"].format(contents)
-
-    # print(contents)
+    root = os.path.join(PATHS["images"], profile, key)
+    contents = {}
+    for fn in list_pngs(root):
+        n = fn[:-4]
+        p = " ".join(map(format_token, n.split("-")))
+        contents[n] = {
+            "path": ["images", profile, key, fn],
+            "name": p,
+        }
 
     with open(JSONS["paths"][key], "w") as f:
-        f.write(contents)
+        json.dump(contents, f, separators=(",", ":"))
+
+
+@functools.lru_cache(maxsize=4096)
+def format_token(token):
+    """
+    Formats one hyphen-separated token of a spritesheet's filename for
+    display, e.g. "a" becomes "(A)" and "archer" becomes "Archer".
+    Two-letter tokens are kept as-is.
+
+    :param token: Filename token to format.
+
+    :return: Display-ready token.
+    """
+    if len(token) == 1:
+        return "({})".format(token.capitalize())
+    elif len(token) == 2:
+        return token
+    else:
+        return token.capitalize()
+
+
+def load_json(path):
+    """
+    Loads and returns the contents of a JSON file.
+
+    Parsed contents are cached until the file is modified, so the returned
+    data is shared between callers and shouldn't be modified.
+
+    :param path: Path to JSON file.
+
+    :return: Parsed JSON contents.
+    """
+    stat = os.stat(path)
+    return load_json_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def load_json_cached(path, mtime, size):
+    """
+    Loads and returns the contents of a JSON file.
+
+    :param path:  Path to JSON file.
+    :param mtime: Modification time of file. (Nanoseconds).
+    :param size:  Size of file. (Bytes).
+
+    :return: Parsed JSON contents.
+    """
+    with open(path, "rb") as f:
+        data = json_loads(f.read())
+    return data
 
 
 def load_offsets(key, profile):
@@ -99,9 +141,8 @@ def load_offsets(key, profile):
 
     :return: Dictionary containing all (x,y) offsets.
     """
-    with open(JSONS["offset"][key], "r") as f:
-        data = json.load(f).get(JSON_KEY_RESERVE.format(profile), {})
-    return data
+    data = load_json(JSONS["offset"][key])
+    return data.get(JSON_KEY_RESERVE.format(profile), {})
 
 
 def load_paths(key):
@@ -112,9 +153,7 @@ def load_paths(key):
 
     :return: Dictionary containing spritesheet filepaths.
     """
-    with open(JSONS["paths"][key], "r") as f:
-        data = json.load(f)
-    return data
+    return load_json(JSONS["paths"][key])
 
 
 def load_create(key):
@@ -125,9 +164,7 @@ def load_create(key):
 
     :return: Dictionary containing cropping rules for body spritesheets.
     """
-    with open(JSONS["sources"][key], "r") as f:
-        data = json.load(f)
-    return data
+    return load_json(JSONS["sources"][key])
 
 
 def load_source_coloring():
@@ -136,9 +173,7 @@ def load_source_coloring():
 
     :return: Dictionary containing color region order.
     """
-    with open(JSONS["sources"]["color"], "r") as f:
-        data = json.load(f)
-    return data
+    return load_json(JSONS["sources"]["color"])
 
 
 def load_source_cropping():
@@ -147,6 +182,4 @@ def load_source_cropping():
 
     :return: Dictionary containing standard cropping regions.
     """
-    with open(JSONS["sources"]["crop"], "r") as f:
-        data = json.load(f)
-    return data
+    return load_json(JSONS["sources"]["crop"])
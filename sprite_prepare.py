@@ -6,6 +6,9 @@ Fire Emblem 3DS Sprite Compositing Tool
 Creates intermediate spritesheets used during the final compositing process.
 
 """
+import concurrent.futures
+import functools
+import numpy as np
 from PIL import Image
 from sprite_json import *
 from sprite_utils import *
@@ -15,66 +18,172 @@ Default PIL image mode.
 """
 MODE = "RGBA"
 
+""" 
+zlib compression level for intermediate PNGs. These are regenerated on
+demand, so encoding speed matters more than file size.
+"""
+PNG_COMPRESS_LEVEL = 1
+
+""" 
+(Frame, stance) keys of each row on intermediate spritesheets, in order.
+"""
+BODY_FRAMES = tuple(
+    (str(k), s) for k in range(4) for s in ("idle", "left", "right")
+)
+HEAD_FRAMES = tuple(
+    (str(k), s) for k in range(4)
+    for s in ("idle", "large-direction", "small-direction")
+)
+
 
-def crop_image(im, x, y, w, h):
+def copy_rect(dest, src, rect, top):
     """
-    Crops a PIL image.
+    Copies a rectangular region of one image array into another, at the
+    left edge of the given row. (In-place).
 
-    :param im: Image to crop.
-    :param x:  Topleft x-coordinate to crop from.
-    :param y:  Topleft y-coordinate to crop from.
-    :param w:  Width to crop to.
-    :param h:  Height to crop to.
+    Parts of the region outside the source image are copied as transparent
+    black; parts outside the destination are dropped.
 
-    :return: Specified subregion from image.
+    :param dest: Destination image array to modify.
+    :param src:  Source image array to copy from.
+    :param rect: Topleft x-coordinate, y-coordinate, width, and height of
+                 region to copy.
+    :param top:  Destination row to copy to.
+
+    :return: None.
     """
-    return im.crop((x, y, w + x, h + y))
+    x, y, w, h = rect
+    bottom = min(top + h, dest.shape[0])
+    right = min(w, dest.shape[1])
+    if bottom <= top or right <= 0:
+        return
+
+    # Clip region to source bounds
+    y0, x0 = max(y, 0), max(x, 0)
+    y1 = min(y + bottom - top, src.shape[0])
+    x1 = min(x + right, src.shape[1])
+
+    if y0 != y or x0 != x or y1 != y + bottom - top or x1 != x + right:
+        # Region is partially outside source image
+        dest[top:bottom, :right] = 0
+
+    if y1 > y0 and x1 > x0:
+        dest[top + y0 - y:top + y1 - y, x0 - x:x1 - x] = src[y0:y1, x0:x1]
 
 
 def make_image(w, h):
     """
-    Creates a blank PIL image.
+    Creates a blank image array.
 
     :param w: Width of image.
     :param h: Height of image.
 
-    :return: Blank RGBA image with the given dimensions.
+    :return: Blank opaque black RGBA image array with the given dimensions.
     """
-    return Image.new(MODE, (w, h), (0, 0, 0, 255))
+    image = np.zeros((h, w, 4), np.uint8)
+    image[:, :, 3] = 255
+    return image
 
 
-def prepare(key, profile):
+def make_rects(data, profile, frames):
+    """
+    Flattens cropping rules into a tuple of rectangles per spritesheet.
+
+    :param data:    Head or body data to use.
+    :param profile: Profile key.
+    :param frames:  (Frame, stance) keys to look up, in order.
+
+    :return: Dictionary mapping spritesheet names to cropping rectangles.
+    """
+    rules = data[JSON_KEY_RESERVE.format(profile)]
+    return {
+        name: tuple(tuple(rule[k][s]) for k, s in frames)
+        for name, rule in rules.items()
+    }
+
+
+def open_image(filename):
+    """
+    Opens a PNG image, decoded up front and converted to the default mode.
+
+    :param filename: Path to PNG file.
+
+    :return: In-memory RGBA image.
+    """
+    im = Image.open(filename, formats=("PNG",))
+    im.load()
+    if im.mode != MODE:
+        im = im.convert(MODE)
+    return im
+
+
+def prepare(key, profile, workers=None, *, force=False):
     """
     Creates intermediate spritesheets.
 
-    :param key: Either of "head" or "body".
+    Spritesheets are independent of each other, so they're generated in
+    parallel across worker processes. Spritesheets newer than both their
+    source image and the cropping rules are skipped unless forced.
+
+    :param key:     Either of "head" or "body".
+    :param profile: Profile key.
+    :param workers: Maximum number of worker processes. (Default CPU count).
+    :param force:   Whether to regenerate up-to-date spritesheets too.
+                    (Default False).
 
     :return: None.
     """
     print("Now generating intermediate {} spritesheets...".format(key))
 
     data = load_create(key)
-    dir = os.path.join(PATHS["source"]["root"], profile, key, "*.png")
-    files = glob.glob(dir)
-    files.sort()
+    dir = os.path.join(PATHS["source"]["root"], profile, key)
+    root = fix_path(os.path.join(PATHS["images"], profile, key))
+    names = list_pngs(dir)
+    if not force:
+        rules = JSONS["sources"][key]
+        names = [
+            name for name in names
+            if not is_up_to_date(
+                os.path.join(root, name), os.path.join(dir, name), rules
+            )
+        ]
+
+    frames = HEAD_FRAMES if key == "head" else BODY_FRAMES
+    rects = make_rects(data, profile, frames)
+    callback = functools.partial(prepare_file, key, rects, dir, root)
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        for filename in executor.map(callback, names, chunksize=4):
+            print("Generated intermediate for {}...".format(filename))
 
-    for filename in files:
-        print("Generating intermediate for {}...".format(filename))
+    print("Intermediate {} spritesheets complete!".format(key))
 
-        root = fix_path(os.path.join(PATHS["images"], profile, key))
-        path = os.path.join(root, os.path.split(filename)[-1])
 
-        if key == "head":
-            image = process_head(filename, profile, data)
-            image.save(path)
-        elif key == "body":
-            image = process_body(filename, profile, data)
-            image.save(path)
+def prepare_file(key, rects, dir, root, name):
+    """
+    Creates a single intermediate spritesheet.
 
-    print("Intermediate {} spritesheets complete!".format(key))
+    :param key:   Either of "head" or "body".
+    :param rects: Cropping rectangles per spritesheet.
+    :param dir:   Source directory.
+    :param root:  Output directory.
+    :param name:  Filename of source image to crop from.
 
+    :return: Source image path.
+    """
+    filename = os.path.join(dir, name)
+    path = os.path.join(root, name)
 
-def process_body(filename, profile, data):
+    if key == "head":
+        image = process_head(filename, rects)
+        image.save(path, compress_level=PNG_COMPRESS_LEVEL)
+    elif key == "body":
+        image = process_body(filename, rects)
+        image.save(path, compress_level=PNG_COMPRESS_LEVEL)
+
+    return filename
+
+
+def process_body(filename, rects):
     """
     Processes an input "body" image.
 
@@ -83,41 +192,14 @@ def process_body(filename, profile, data):
     a single intermediate spritesheet.
 
     :param filename: Source image to crop from.
-    :param data:     Body data to use.
+    :param rects:    Cropping rectangles per spritesheet.
 
     :return: Newly-generated spritesheet.
     """
-    img = Image.open(filename)
-
-    try:
-        key = os.path.splitext(os.path.basename(filename))[0]
-        rectData = data[JSON_KEY_RESERVE.format(profile)][key]
-    except KeyError:
-        rectData = data[JSON_KEY_RESERVE.format(profile)][JSON_KEY_DEFAULT]
-
-    rects = [
-        crop_image(img, *rectData["0"]["idle"]),
-        crop_image(img, *rectData["0"]["left"]),
-        crop_image(img, *rectData["0"]["right"]),
-        crop_image(img, *rectData["1"]["idle"]),
-        crop_image(img, *rectData["1"]["left"]),
-        crop_image(img, *rectData["1"]["right"]),
-        crop_image(img, *rectData["2"]["idle"]),
-        crop_image(img, *rectData["2"]["left"]),
-        crop_image(img, *rectData["2"]["right"]),
-        crop_image(img, *rectData["3"]["idle"]),
-        crop_image(img, *rectData["3"]["left"]),
-        crop_image(img, *rectData["3"]["right"]),
-    ]
-
-    output = make_image(256, len(rects) * 32)
-    for n, r in enumerate(rects):
-        output.paste(r, (0, n * 32))
-
-    return output
+    return process_image(filename, rects, 32)
 
 
-def process_head(filename, profile, data):
+def process_head(filename, rects):
     """
     Processes an input "head" image.
 
@@ -126,40 +208,37 @@ def process_head(filename, profile, data):
     a single intermediate spritesheet.
 
     :param filename: Source image to crop from.
-    :param data:     Head data to use.
+    :param rects:    Cropping rectangles per spritesheet.
 
     :return: Newly-generated spritesheet.
     """
-    img = Image.open(filename)
-
-    try:
-        key = os.path.splitext(os.path.basename(filename))[0]
-        rectData = data[JSON_KEY_RESERVE.format(profile)][key]
-    except KeyError:
-        rectData = data[JSON_KEY_RESERVE.format(profile)][JSON_KEY_DEFAULT]
-
-    rects = [
-        crop_image(img, *rectData["0"]["idle"]),
-        crop_image(img, *rectData["0"]["large-direction"]),
-        crop_image(img, *rectData["0"]["small-direction"]),
-        crop_image(img, *rectData["1"]["idle"]),
-        crop_image(img, *rectData["1"]["large-direction"]),
-        crop_image(img, *rectData["1"]["small-direction"]),
-        crop_image(img, *rectData["2"]["idle"]),
-        crop_image(img, *rectData["2"]["large-direction"]),
-        crop_image(img, *rectData["2"]["small-direction"]),
-        crop_image(img, *rectData["3"]["idle"]),
-        crop_image(img, *rectData["3"]["large-direction"]),
-        crop_image(img, *rectData["3"]["small-direction"]),
-    ]
-
-    output = make_image(256, len(rects) * 64)
+    return process_image(filename, rects, 64)
+
+
+def process_image(filename, rects, height):
+    """
+    Stacks cropped frames of an input image into an intermediate spritesheet.
+
+    :param filename: Source image to crop from.
+    :param rects:    Cropping rectangles per spritesheet.
+    :param height:   Height of each row on the output spritesheet.
+
+    :return: Newly-generated spritesheet.
+    """
+    img = open_image(filename)
+
+    key = os.path.splitext(os.path.basename(filename))[0]
+    rects = rects.get(key) or rects[JSON_KEY_DEFAULT]
+
+    source = np.asarray(img)
+    output = make_image(256, len(rects) * height)
     for n, r in enumerate(rects):
-        output.paste(r, (0, n * 64))
+        copy_rect(output, source, r, n * height)
 
-    return output
+    return Image.fromarray(output)
 
 
 if __name__ == "__main__":
-    prepare("body", "echoes")
-    prepare("head", "echoes")
+    force = "--force" in sys.argv[1:]
+    prepare("body", "echoes", force=force)
+    prepare("head", "echoes", force=force)
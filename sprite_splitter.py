@@ -225,7 +225,7 @@ def process_body(name, image, where, body_data, source_data, is_alpha):
     layers = split(Crop(image, where, REGION_FULL_BODY))
     if is_alpha:
         layers = {
-            k: ReplaceColor(v, [0, 0, 0, 255], [0, 0, 0, 0])
+            k: ReplaceColor(v, [0, 0, 0, 255], [0, 0, 0, 0], inplace=True)
             for k, v in layers.items()
         }
 
@@ -281,7 +281,7 @@ def process_head(name, image, where, head_data, source_data, is_alpha):
     layers = split(Crop(image, where, REGION_FULL_HEAD))
     if is_alpha:
         layers = {
-            k: ReplaceColor(v, [0, 0, 0, 255], [0, 0, 0, 0])
+            k: ReplaceColor(v, [0, 0, 0, 255], [0, 0, 0, 0], inplace=True)
             for k, v in layers.items()
         }
 
@@ -535,6 +535,7 @@ def composite(profile,
                     ConvertAlpha(new_gray),
                     [0, 0, 0, 255],
                     [0, 0, 0, 0],
+                    inplace=True,
                 )
 
             if idle_only:
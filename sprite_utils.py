@@ -75,5 +75,39 @@ def fix_path(path):
     return path
 
 
+def is_up_to_date(path, *sources):
+    """
+    Checks whether a generated file is at least as new as all its sources.
+
+    :param path:    Relative path to generated file.
+    :param sources: Relative paths to files it was generated from.
+
+    :return: True if file exists and no source is newer; false otherwise.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return all(os.stat(source).st_mtime_ns <= mtime for source in sources)
+
+
+def list_pngs(path):
+    """
+    Lists PNG files within a directory, sorted by name.
+
+    Hidden files are skipped, as they would be by glob.
+
+    :param path: Relative path to directory.
+
+    :return: List of PNG filenames (without directory).
+    """
+    return sorted(
+        entry.name for entry in os.scandir(path)
+        if entry.name.endswith(".png")
+        and not entry.name.startswith(".")
+        and entry.is_file()
+    )
+
+
 if __name__ == "__main__":
     flush_outputs()